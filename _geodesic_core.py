@@ -0,0 +1,196 @@
+"""
+Shared geometry for the SMCL "Burst of Knowledge" geodesic sphere.
+
+Builds the subdivided icosahedron with shrunk, floating faces used by both the
+matplotlib model and the Manim animations, so every module shares one
+implementation and one Numba compile cache.
+"""
+
+import functools
+import os
+
+import numpy as np
+
+# The Numba kernels are opt-in: importing numba and dispatching the compiled
+# kernels costs far more than the NumPy build they replace. Even then numba is
+# imported only when a sphere is first built, not when this module is imported.
+USE_NUMBA = os.environ.get("SMCL_GEODESIC_NUMBA") == "1"
+
+
+def _build_icosahedron():
+    """Builds the unit vertices and faces of a regular icosahedron."""
+    t = (1.0 + np.sqrt(5.0)) / 2.0
+
+    # Vertices
+    verts = np.array([
+        [-1,  t,  0], [ 1,  t,  0], [-1, -t,  0], [ 1, -t,  0],
+        [ 0, -1,  t], [ 0,  1,  t], [ 0, -1, -t], [ 0,  1, -t],
+        [ t,  0, -1], [ t,  0,  1], [-t,  0, -1], [-t,  0,  1]
+    ])
+    # Every vertex lies sqrt(1 + t^2) from the origin; one divide normalizes them
+    verts = (verts / np.sqrt(1.0 + t * t)).astype(np.float32)
+
+    # Faces (indices of vertices)
+    faces = np.array([
+        [0, 11, 5], [0, 5, 1], [0, 1, 7], [0, 7, 10], [0, 10, 11],
+        [1, 5, 9], [5, 11, 4], [11, 10, 2], [10, 7, 6], [7, 1, 8],
+        [3, 9, 4], [3, 4, 2], [3, 2, 6], [3, 6, 8], [3, 8, 9],
+        [4, 9, 5], [2, 4, 11], [6, 2, 10], [8, 6, 7], [9, 8, 1]
+    ])
+
+    verts.setflags(write=False)
+    faces.setflags(write=False)
+    return verts, faces
+
+
+_ICO_VERTS, _ICO_FACES = _build_icosahedron()
+
+
+def get_icosahedron():
+    """Returns vertices and faces of a regular icosahedron."""
+    return _ICO_VERTS, _ICO_FACES
+
+
+def subdivide(verts, faces):
+    """Subdivides each triangle into 4 smaller triangles."""
+    # Gather the three edges of every face; shared edges collapse to a
+    # single midpoint through np.unique
+    edges = np.sort(faces[:, [[0, 1], [1, 2], [2, 0]]].reshape(-1, 2), axis=1)
+    uniq, inv = np.unique(edges, axis=0, return_inverse=True)
+
+    # Calculate midpoints and normalize to push them to sphere surface
+    mids = (verts[uniq[:, 0]] + verts[uniq[:, 1]]) * 0.5
+    mids /= np.linalg.norm(mids, axis=1, keepdims=True)
+
+    v1, v2, v3 = faces.T
+    a, b, c = (inv.reshape(-1, 3) + len(verts)).T
+
+    new_faces = np.stack([
+        np.column_stack([v1, a, c]),
+        np.column_stack([v2, b, a]),
+        np.column_stack([v3, c, b]),
+        np.column_stack([a, b, c])
+    ], axis=1).reshape(-1, 3)
+
+    return np.vstack([verts, mids]), new_faces
+
+
+def _subdivide_loop(verts, faces):
+    """
+    Subdivides each triangle into 4 smaller triangles using explicit loops,
+    for compilation with Numba. Midpoints are numbered in sorted edge order,
+    so the result matches subdivide() exactly.
+    """
+    n_verts = verts.shape[0]
+    n_faces = faces.shape[0]
+
+    # Pack each ordered edge into one int64: low index in the high bits
+    keys = np.empty(3 * n_faces, dtype=np.int64)
+    for f in range(n_faces):
+        for e in range(3):
+            i1 = faces[f, e]
+            i2 = faces[f, (e + 1) % 3]
+            lo, hi = (i1, i2) if i1 < i2 else (i2, i1)
+            keys[3 * f + e] = (np.int64(lo) << 32) | hi
+
+    # Walk the edges in sorted key order, adding a midpoint per unique edge
+    order = np.argsort(keys)
+    mid = np.empty(3 * n_faces, dtype=np.int64)
+    new_verts = np.empty((n_verts + 3 * n_faces, 3), dtype=verts.dtype)
+    new_verts[:n_verts] = verts
+
+    count = n_verts
+    prev = -1
+    for r in range(3 * n_faces):
+        key = keys[order[r]]
+        if key != prev:
+            m = (verts[key >> 32] + verts[key & 0xFFFFFFFF]) * 0.5
+            new_verts[count] = m / np.sqrt(np.sum(m * m))
+            count += 1
+            prev = key
+        mid[order[r]] = count - 1
+
+    new_faces = np.empty((4 * n_faces, 3), dtype=faces.dtype)
+    for f in range(n_faces):
+        v1, v2, v3 = faces[f, 0], faces[f, 1], faces[f, 2]
+        a, b, c = mid[3 * f], mid[3 * f + 1], mid[3 * f + 2]
+        new_faces[4 * f] = (v1, a, c)
+        new_faces[4 * f + 1] = (v2, b, a)
+        new_faces[4 * f + 2] = (v3, c, b)
+        new_faces[4 * f + 3] = (a, b, c)
+
+    return new_verts[:count].copy(), new_faces
+
+
+def _shrink_faces_loop(verts, faces, scale, shrink_factor):
+    """Returns an (N, 3, 3) array of scaled triangles shrunk toward their centers."""
+    triangles = np.empty((faces.shape[0], 3, 3), dtype=verts.dtype)
+    for f in range(faces.shape[0]):
+        for k in range(3):
+            center = (verts[faces[f, 0], k] + verts[faces[f, 1], k]
+                      + verts[faces[f, 2], k]) * scale / 3.0
+            for j in range(3):
+                v = verts[faces[f, j], k] * scale
+                triangles[f, j, k] = center + (v - center) * shrink_factor
+    return triangles
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_kernels():
+    """
+    Imports numba and wraps the loop kernels, returning None when numba is
+    not installed.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_subdivide_loop), njit(cache=True)(_shrink_faces_loop)
+
+
+def _shrink_faces(verts, faces, scale, shrink_factor):
+    """
+    Gathers the vertices of every face at once and shrinks them toward their
+    centers: New_V = Center + (V - Center) * factor
+    """
+    tri_verts = verts[faces] * scale
+    centers = tri_verts.mean(axis=1, keepdims=True)
+    return centers + (tri_verts - centers) * shrink_factor
+
+
+def _build_geodesic_geometry(subdivisions, shrink_factor, scale):
+    """Builds the (N, 3, 3) shrunk triangles, scaled vertices and faces."""
+    verts, faces = get_icosahedron()
+
+    kernels = _numba_kernels() if USE_NUMBA else None
+    split, shrink = kernels or (subdivide, _shrink_faces)
+    for _ in range(subdivisions):
+        verts, faces = split(verts, faces)
+
+    shrunk = shrink(verts, faces, scale, shrink_factor)
+
+    return shrunk.astype(np.float32), verts * scale, faces
+
+
+@functools.lru_cache(maxsize=8)
+def geodesic_geometry(subdivisions=2, shrink_factor=0.75, scale=2.5):
+    """
+    Returns the geodesic sphere as read-only arrays: the shrunk triangles as
+    one contiguous (N, 3, 3) float32 array, the scaled vertices, and the faces.
+
+    Results are memoized per process, so every scene and caller shares one
+    build of each sphere.
+    """
+    tris_arr, verts, faces = _build_geodesic_geometry(
+        subdivisions, shrink_factor, scale
+    )
+    tris_arr = np.ascontiguousarray(tris_arr, dtype=np.float32)
+    for arr in (tris_arr, verts, faces):
+        arr.setflags(write=False)
+
+    return tris_arr, verts, faces
+
+
+def icosphere(subdivisions=2, shrink_factor=0.75, scale=2.5):
+    """Returns the (N, 3, 3) float32 array of shrunk geodesic sphere triangles."""
+    return geodesic_geometry(subdivisions, shrink_factor, scale)[0]
@@ -7,101 +7,64 @@ Usage:
     manim -pql geodesic_2d.py LogoStyle           # Low quality preview
     manim -pqh geodesic_2d.py LogoStyle           # High quality
     manim -pql geodesic_2d.py LogoRotate2D        # 2D rotation animation
+    python geodesic_2d.py                         # Rotation video without Manim
 """
 
+import subprocess
+
 from manim import *
 import numpy as np
+from PIL import Image, ImageColor, ImageDraw
 
+from _geodesic_core import geodesic_geometry
 
-def normalize(v):
-    """Normalize a vector or array of vectors to unit length."""
-    norm = np.linalg.norm(v, axis=1, keepdims=True)
-    return v / norm
-
-
-def get_icosahedron():
-    """Returns vertices and faces of a regular icosahedron."""
-    t = (1.0 + np.sqrt(5.0)) / 2.0
-
-    verts = np.array([
-        [-1,  t,  0], [ 1,  t,  0], [-1, -t,  0], [ 1, -t,  0],
-        [ 0, -1,  t], [ 0,  1,  t], [ 0, -1, -t], [ 0,  1, -t],
-        [ t,  0, -1], [ t,  0,  1], [-t,  0, -1], [-t,  0,  1]
-    ], dtype=float)
-
-    faces = np.array([
-        [0, 11, 5], [0, 5, 1], [0, 1, 7], [0, 7, 10], [0, 10, 11],
-        [1, 5, 9], [5, 11, 4], [11, 10, 2], [10, 7, 6], [7, 1, 8],
-        [3, 9, 4], [3, 4, 2], [3, 2, 6], [3, 6, 8], [3, 8, 9],
-        [4, 9, 5], [2, 4, 11], [6, 2, 10], [8, 6, 7], [9, 8, 1]
-    ])
 
-    return normalize(verts), faces
-
-
-def subdivide(verts, faces):
-    """Subdivides each triangle into 4 smaller triangles."""
-    new_faces = []
-    new_verts = verts.tolist()
-    midpoint_cache = {}
-
-    def get_midpoint(i1, i2):
-        key = tuple(sorted((i1, i2)))
-        if key in midpoint_cache:
-            return midpoint_cache[key]
-
-        v1, v2 = verts[i1], verts[i2]
-        mid = (v1 + v2) / 2.0
-        mid = mid / np.linalg.norm(mid)
+def _rot_x(theta):
+    """Return the rotation matrix for rotation around the x axis by theta radians."""
+    c, s = np.cos(theta), np.sin(theta)
+    return np.array([
+        [1, 0, 0],
+        [0, c, s],
+        [0, -s, c]
+    ], dtype=np.float32)
 
-        new_verts.append(mid)
-        idx = len(new_verts) - 1
-        midpoint_cache[key] = idx
-        return idx
 
-    for f in faces:
-        v1, v2, v3 = f
-        a = get_midpoint(v1, v2)
-        b = get_midpoint(v2, v3)
-        c = get_midpoint(v3, v1)
+def _rot_y(theta):
+    """Return the rotation matrix for rotation around the y axis by theta radians."""
+    c, s = np.cos(theta), np.sin(theta)
+    return np.array([
+        [c, 0, -s],
+        [0, 1, 0],
+        [s, 0, c]
+    ], dtype=np.float32)
 
-        new_faces.extend([
-            [v1, a, c],
-            [v2, b, a],
-            [v3, c, b],
-            [a, b, c]
-        ])
 
-    return np.array(new_verts), np.array(new_faces)
+def rotation_frames(num_frames, angle_x=0.4):
+    """
+    Return an (F, 3, 3) stack of rotations for one full turn around the y axis,
+    each following a fixed tilt of angle_x around the x axis.
+    """
+    angles = 2 * PI * np.arange(num_frames) / num_frames
+    c, s = np.cos(angles), np.sin(angles)
 
+    rot_y = np.zeros((num_frames, 3, 3), dtype=np.float32)
+    rot_y[:, 0, 0] = c
+    rot_y[:, 0, 2] = -s
+    rot_y[:, 1, 1] = 1
+    rot_y[:, 2, 0] = s
+    rot_y[:, 2, 2] = c
 
-def rotation_matrix(axis, theta):
-    """Return the rotation matrix for rotation around axis by theta radians."""
-    axis = axis / np.linalg.norm(axis)
-    a = np.cos(theta / 2.0)
-    b, c, d = -axis * np.sin(theta / 2.0)
-    return np.array([
-        [a*a+b*b-c*c-d*d, 2*(b*c-a*d), 2*(b*d+a*c)],
-        [2*(b*c+a*d), a*a+c*c-b*b-d*d, 2*(c*d-a*b)],
-        [2*(b*d-a*c), 2*(c*d+a*b), a*a+d*d-b*b-c*c]
-    ])
+    return rot_y @ _rot_x(angle_x)
 
 
 def create_geodesic_triangles_3d(subdivisions=2, shrink_factor=0.75, scale=2.5):
-    """Creates 3D triangle vertices for the geodesic sphere."""
-    verts, faces = get_icosahedron()
-
-    for _ in range(subdivisions):
-        verts, faces = subdivide(verts, faces)
-
-    triangles = []
-    for face in faces:
-        tri_verts = verts[face] * scale
-        center = np.mean(tri_verts, axis=0)
-        shrunk_verts = center + (tri_verts - center) * shrink_factor
-        triangles.append(shrunk_verts)
+    """
+    Creates 3D triangle vertices for the geodesic sphere.
 
-    return triangles, verts * scale, faces
+    Returns the triangles as one contiguous (N, 3, 3) float32 array, the
+    scaled vertices, and the faces.
+    """
+    return geodesic_geometry(subdivisions, shrink_factor, scale)
 
 
 def project_to_2d(triangles_3d, view_angle_x=0.3, view_angle_y=0.2):
@@ -110,25 +73,24 @@ def project_to_2d(triangles_3d, view_angle_x=0.3, view_angle_y=0.2):
     Rotates the sphere first to get a good viewing angle.
     """
     # Apply rotation to get a good view angle
-    rot_x = rotation_matrix(np.array([1, 0, 0]), view_angle_x)
-    rot_y = rotation_matrix(np.array([0, 1, 0]), view_angle_y)
-    rot = rot_y @ rot_x
-
-    triangles_2d = []
-    z_depths = []
-
-    for tri in triangles_3d:
-        # Rotate the triangle
-        rotated = (rot @ tri.T).T
-        # Project to 2D (just drop z, orthographic projection)
-        tri_2d = rotated[:, :2]
-        triangles_2d.append(tri_2d)
-        # Store average z depth for sorting
-        z_depths.append(np.mean(rotated[:, 2]))
+    rot = _rot_y(view_angle_y) @ _rot_x(view_angle_x)
+
+    # Rotate all triangles in one batch: (N, 3, 3) @ (3, 3)
+    rotated = np.asarray(triangles_3d) @ rot.T
+    # Project to 2D (just drop z, orthographic projection)
+    triangles_2d = rotated[:, :, :2]
+    # Store average z depth for sorting
+    z_depths = rotated[:, :, 2].mean(axis=1)
 
     return triangles_2d, z_depths
 
 
+def lift_to_plane(triangles_2d):
+    """Append z = 0 to an (N, 3, 2) batch of projected triangles for Manim."""
+    zeros = np.zeros((len(triangles_2d), 3, 1))
+    return np.concatenate([triangles_2d, zeros], axis=2, dtype=float)
+
+
 class LogoStyle(Scene):
     """2D logo-style view with fade-in and rotation."""
 
@@ -136,36 +98,27 @@ class LogoStyle(Scene):
         smcl_blue = "#4169E1"
 
         # Create 3D triangles
-        triangles_3d, _, _ = create_geodesic_triangles_3d(
+        tris_arr, _, _ = create_geodesic_triangles_3d(
             subdivisions=2, shrink_factor=0.75, scale=2.5
         )
 
         def create_frame(angle_y, base_angle_x=0.4):
             """Create a frame of the rotating sphere at a given angle."""
-            rot_x = rotation_matrix(np.array([1, 0, 0]), base_angle_x)
-            rot_y = rotation_matrix(np.array([0, 1, 0]), angle_y)
-            rot = rot_y @ rot_x
+            rot = _rot_y(angle_y) @ _rot_x(base_angle_x)
 
-            triangles_2d = []
-            z_depths = []
-
-            for tri in triangles_3d:
-                rotated = (rot @ tri.T).T
-                tri_2d = rotated[:, :2]
-                triangles_2d.append(tri_2d)
-                z_depths.append(np.mean(rotated[:, 2]))
+            rotated = tris_arr @ rot.T
+            triangles_2d = rotated[:, :, :2]
+            z_depths = rotated[:, :, 2].mean(axis=1)
 
             sorted_indices = np.argsort(z_depths)
+            opacities = np.clip(0.6 + 0.4 * (z_depths + 2.5) / 5.0, 0.4, 1.0)
+            points_3d = lift_to_plane(triangles_2d)
 
             triangle_group = VGroup()
 
             for idx in sorted_indices:
-                tri_2d = triangles_2d[idx]
-                z = z_depths[idx]
-                opacity = 0.6 + 0.4 * (z + 2.5) / 5.0
-                opacity = np.clip(opacity, 0.4, 1.0)
-
-                points = [np.array([v[0], v[1], 0]) for v in tri_2d]
+                points = points_3d[idx]
+                opacity = opacities[idx]
 
                 triangle = Polygon(
                     *points,
@@ -216,63 +169,62 @@ class LogoRotate2D(Scene):
         smcl_blue = "#4169E1"
 
         # Create 3D triangles
-        triangles_3d, _, _ = create_geodesic_triangles_3d(
+        tris_arr, _, _ = create_geodesic_triangles_3d(
             subdivisions=2, shrink_factor=0.75, scale=2.5
         )
 
-        def create_frame(angle_y):
-            """Create a frame of the rotating sphere at a given angle."""
-            rot_x = rotation_matrix(np.array([1, 0, 0]), 0.4)
-            rot_y = rotation_matrix(np.array([0, 1, 0]), angle_y)
-            rot = rot_y @ rot_x
-
-            triangles_2d = []
-            z_depths = []
-
-            for tri in triangles_3d:
-                rotated = (rot @ tri.T).T
-                tri_2d = rotated[:, :2]
-                triangles_2d.append(tri_2d)
-                z_depths.append(np.mean(rotated[:, 2]))
-
-            sorted_indices = np.argsort(z_depths)
-
-            triangle_group = VGroup()
-
-            for idx in sorted_indices:
-                tri_2d = triangles_2d[idx]
-                z = z_depths[idx]
-                opacity = 0.6 + 0.4 * (z + 2.5) / 5.0
-                opacity = np.clip(opacity, 0.4, 1.0)
-
-                points = [np.array([v[0], v[1], 0]) for v in tri_2d]
-
-                triangle = Polygon(
-                    *points,
-                    fill_color=smcl_blue,
-                    fill_opacity=opacity,
-                    stroke_color=smcl_blue,
-                    stroke_width=0.5,
-                )
-                triangle_group.add(triangle)
-
-            return triangle_group
-
-        # Create initial frame
-        current_frame = create_frame(0)
-        self.add(current_frame)
+        # Build the polygons once; each frame only moves their corners and
+        # updates opacity and draw order
+        polygons = VGroup(*[
+            Polygon(
+                *tri.astype(float),
+                fill_color=smcl_blue,
+                fill_opacity=0,
+                stroke_color=smcl_blue,
+                stroke_width=0.5,
+            )
+            for tri in tris_arr
+        ])
 
-        # Animate rotation
+        # Geometry for every step of one turn, computed up front:
+        # (F, N, 3, 3) rotated triangles plus per-triangle depths, opacities
+        # and back-to-front draw order
         num_steps = 120
-        for i in range(1, num_steps + 1):
-            angle = 2 * PI * i / num_steps
-            new_frame = create_frame(angle)
+        rots = rotation_frames(num_steps, angle_x=0.4)
+        rotated_all = np.einsum("fij,nkj->fnki", rots, tris_arr)
+        z_depths_all = rotated_all[..., 2].mean(axis=2)
+        opacities_all = np.clip(0.6 + 0.4 * (z_depths_all + 2.5) / 5.0, 0.4, 1.0)
+        order_all = np.argsort(z_depths_all, axis=1)
+
+        def update_frame(step):
+            """Pose the cached polygons for the given rotation step."""
+            sorted_indices = order_all[step]
+            opacities = opacities_all[step]
+            points_3d = lift_to_plane(rotated_all[step, ..., :2])
+
+            for rank, idx in enumerate(sorted_indices):
+                points = points_3d[idx]
+                opacity = opacities[idx]
+
+                polygon = polygons[idx]
+                polygon.set_points_as_corners([*points, points[0]])
+                polygon.set_fill(smcl_blue, opacity=opacity)
+                polygon.set_z_index(rank)
 
-            self.remove(current_frame)
-            self.add(new_frame)
-            current_frame = new_frame
+        # Create initial frame
+        update_frame(0)
+        self.add(polygons)
 
-            self.wait(1/30)
+        # Animate one full rotation (120 steps at 30fps); the last step
+        # wraps around to the starting pose
+        self.play(
+            UpdateFromAlphaFunc(
+                polygons,
+                lambda _, alpha: update_frame(round(alpha * num_steps) % num_steps),
+                rate_func=linear,
+                run_time=4,
+            )
+        )
 
         self.wait(1)
 
@@ -281,62 +233,131 @@ class LogoBuildUp(Scene):
     """Animated build-up of the 2D logo with triangles flying in."""
 
     def construct(self):
-        triangles_3d, _, _ = create_geodesic_triangles_3d(
+        tris_arr, _, _ = create_geodesic_triangles_3d(
             subdivisions=2, shrink_factor=0.75, scale=2.5
         )
 
         triangles_2d, z_depths = project_to_2d(
-            triangles_3d, view_angle_x=0.4, view_angle_y=0.3
+            tris_arr, view_angle_x=0.4, view_angle_y=0.3
         )
 
         sorted_indices = np.argsort(z_depths)
+        opacities = np.clip(0.6 + 0.4 * (z_depths + 2.5) / 5.0, 0.4, 1.0)
+        points_3d = lift_to_plane(triangles_2d)
         smcl_blue = "#4169E1"
 
-        # Create triangles starting from random positions outside
-        triangles_start = VGroup()
-        triangles_end = VGroup()
+        # Create the triangles at their final positions, back-to-front
+        triangles = VGroup()
 
         for idx in sorted_indices:
-            tri_2d = triangles_2d[idx]
-            z = z_depths[idx]
-            opacity = 0.6 + 0.4 * (z + 2.5) / 5.0
-            opacity = np.clip(opacity, 0.4, 1.0)
-
-            points = [np.array([v[0], v[1], 0]) for v in tri_2d]
+            points = points_3d[idx]
+            opacity = opacities[idx]
 
-            # Final position
-            triangle_end = Polygon(
+            triangle = Polygon(
                 *points,
                 fill_color=smcl_blue,
                 fill_opacity=opacity,
                 stroke_color=smcl_blue,
                 stroke_width=0.5,
             )
+            triangles.add(triangle)
+
+        # Each triangle flies in from outside along the ray through its center
+        end_centers = np.array([t.get_center() for t in triangles])
+        end_opacities = opacities[sorted_indices]
+        directions = np.zeros_like(end_centers)
+        directions[:, :2] = triangles_2d[sorted_indices].mean(axis=1)
+        norms = np.linalg.norm(directions, axis=1, keepdims=True)
+        directions = np.divide(directions, norms, out=directions, where=norms > 0)
+
+        def fly_in(group, alpha):
+            """Place every triangle along its fly-in path at the given progress."""
+            centers = end_centers + directions * 8 * (1 - alpha)
+            for triangle, center, opacity in zip(group, centers, end_opacities * alpha):
+                triangle.move_to(center)
+                triangle.set_opacity(opacity)
+
+        fly_in(triangles, 0)
+        self.add(triangles)
 
-            # Starting position - fly in from outside
-            triangle_start = triangle_end.copy()
-            direction = np.array([np.mean(tri_2d[:, 0]), np.mean(tri_2d[:, 1]), 0])
-            if np.linalg.norm(direction) > 0:
-                direction = direction / np.linalg.norm(direction)
-            triangle_start.shift(direction * 8)
-            triangle_start.set_opacity(0)
+        # Animate triangles flying into position
+        self.play(UpdateFromAlphaFunc(triangles, fly_in, run_time=3))
 
-            triangles_start.add(triangle_start)
-            triangles_end.add(triangle_end)
+        self.wait(2)
 
-        self.add(triangles_start)
 
-        # Animate triangles flying into position
-        self.play(
-            *[
-                AnimationGroup(
-                    t_start.animate.move_to(t_end.get_center()),
-                    t_start.animate.set_opacity(t_end.get_fill_opacity()),
+def render_rotation_mp4(out_path, num_frames=120, fps=30, width=1280, height=720,
+                        color="#4169E1", background="#000000"):
+    """
+    Render the LogoRotate2D rotation straight to an MP4 without Manim.
+
+    Each frame's depth-sorted triangles are filled with Pillow and the
+    raw RGB frames are piped to ffmpeg, which must be on the PATH. The view
+    matches Manim's default 16:9 frame, 8 units tall.
+
+    Args:
+        out_path: Path of the video file to write
+        num_frames: Number of frames for one full turn around the y axis
+        fps: Frame rate of the output video
+        width, height: Output resolution in pixels
+        color: Triangle color
+        background: Background color
+    """
+    tris_arr, _, _ = create_geodesic_triangles_3d(
+        subdivisions=2, shrink_factor=0.75, scale=2.5
+    )
+
+    # Geometry for every frame at once: (F, N, 3, 3) rotated triangles
+    rots = rotation_frames(num_frames, angle_x=0.4)
+    rotated = np.einsum("fij,nkj->fnki", rots, tris_arr)
+
+    # Manim units to pixels, with y pointing down
+    pixels_per_unit = height / 8.0
+    pixels = rotated[..., :2] * [pixels_per_unit, -pixels_per_unit]
+    pixels += [width / 2, height / 2]
+
+    z_depths = rotated[..., 2].mean(axis=2)
+    alphas = np.clip(0.6 + 0.4 * (z_depths + 2.5) / 5.0, 0.4, 1.0) * 255
+    order = np.argsort(z_depths, axis=1)
+    rgb = ImageColor.getrgb(color)
+
+    ffmpeg = subprocess.Popen(
+        [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "rgb24",
+            "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+            "-vcodec", "libx264", "-pix_fmt", "yuv420p", out_path,
+        ],
+        stdin=subprocess.PIPE,
+    )
+
+    try:
+        for f in range(num_frames):
+            img = Image.new("RGB", (width, height), background)
+            draw = ImageDraw.Draw(img, "RGBA")
+
+            # Draw every triangle back-to-front, like LogoRotate2D
+            for idx in order[f]:
+                draw.polygon(
+                    pixels[f, idx].ravel().tolist(),
+                    fill=(*rgb, int(alphas[f, idx])),
+                    outline=rgb,
                 )
-                for t_start, t_end in zip(triangles_start, triangles_end)
-            ],
-            run_time=3,
-            lag_ratio=0.01
-        )
 
-        self.wait(2)
+            ffmpeg.stdin.write(img.tobytes())
+    except BrokenPipeError:
+        pass  # ffmpeg exited early; its status is reported below
+    finally:
+        try:
+            ffmpeg.stdin.close()
+        except BrokenPipeError:
+            pass
+        ffmpeg.wait()
+
+    if ffmpeg.returncode != 0:
+        raise RuntimeError(f"ffmpeg exited with status {ffmpeg.returncode}")
+
+
+if __name__ == "__main__":
+    # Fast path for the rotation video, bypassing Manim's renderer
+    render_rotation_mp4("logo_rotate_2d.mp4")